@@ -5,12 +5,37 @@ This plugin checks for non-ASCII characters in Python source code
 and reports them as style violations.
 """
 
+import re
 import tokenize
-from typing import Generator, Tuple
+from typing import Iterator, List, Tuple
 
 # TODO: Future enhancement - AST-based checking for more granular validation
 # import ast
 
+# Matches any code point outside the 7-bit ASCII range
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+# Lowercased string literal openings (prefix + quote) that are not
+# checked. Bytes literals cannot hold non-ASCII characters at all, so
+# every bytes prefix is skipped outright.
+_SKIP_PREFIXES = frozenset(
+    {'r"', "r'", 'u"', "u'", 'b"', "b'", 'rb"', "rb'", 'br"', "br'"}
+)
+
+# Error codes (also exposed on AsciiChecker)
+_ASC001 = "ASC001 Non-ASCII character found in source code"
+_ASC002 = "ASC002 Non-ASCII character found in string literal"
+_ASC003 = "ASC003 Non-ASCII character found in comment"
+
+# Message templates are built once at import so every checker instance in a
+# flake8 worker shares them. Token types not listed are general source code.
+_DETAIL = " Non-ASCII character '{c}' (U+{cp:04X}) found in "
+_MSG_TEMPLATES = {
+    tokenize.COMMENT: _ASC003 + _DETAIL + "comment",
+    tokenize.STRING: _ASC002 + _DETAIL + "string literal",
+}
+_GENERAL_TEMPLATE = _ASC001 + _DETAIL + "source code"
+
 
 class AsciiChecker:
     """Flake8 plugin to check for non-ASCII characters in source code."""
@@ -19,12 +44,16 @@ class AsciiChecker:
     version = "1.0.2"
 
     # Error codes
-    ASC001 = "ASC001 Non-ASCII character found in source code"
-    ASC002 = "ASC002 Non-ASCII character found in string literal"
-    ASC003 = "ASC003 Non-ASCII character found in comment"
+    ASC001 = _ASC001
+    ASC002 = _ASC002
+    ASC003 = _ASC003
 
     def __init__(
-        self, tree, file_tokens: list = None, filename: str = "<unknown>"
+        self,
+        tree,
+        file_tokens: list = None,
+        filename: str = "<unknown>",
+        lines: list = None,
     ):
         """Initialize the checker.
 
@@ -32,96 +61,79 @@ class AsciiChecker:
             tree: The AST tree (not used in current implementation)
             file_tokens: List of tokens from the source file
             filename: Name of the file being checked
+            lines: Source lines flake8 tokenized (enables the fast path)
         """
         # Note: tree parameter kept for Flake8 compatibility but not used
         # TODO: Future - implement AST-based checking for precision
         self.file_tokens = file_tokens or []
         self.filename = filename
+        self.lines = lines
+        self._cls = type(self)
 
-    def run(self) -> Generator[Tuple[int, int, str, type], None, None]:
+    def run(self) -> Iterator[Tuple[int, int, str, type]]:
         """Run the ASCII validation checks.
 
-        Yields:
-            Tuple of (line_number, column_offset, message, checker_class)
+        Returns:
+            Iterator of (line_number, column_offset, message, checker_class)
         """
+        # Clean files (the common case) are settled by one C-level pass
+        # over the source; tokens are only walked to locate actual violations
+        if self._fast_path():
+            return iter(())
+
         # Simple token-based checking - sufficient for ASCII validation
-        yield from self._check_tokens()
+        return iter(self._check_tokens())
 
-    def _check_tokens(
-        self,
-    ) -> Generator[Tuple[int, int, str, type], None, None]:
+    def _fast_path(self) -> bool:
+        """Return True if the checked source is known to be pure ASCII.
+
+        Uses the lines flake8 tokenized, so the result always matches
+        file_tokens. Without lines, falls back to token checking.
+        """
+        if self.lines is None:
+            return False
+
+        return "".join(self.lines).isascii()
+
+    def _check_tokens(self) -> List[Tuple[int, int, str, type]]:
         """Check tokens for non-ASCII characters."""
+        violations = []
         for token in self.file_tokens:
-            if token.type == tokenize.COMMENT:
-                yield from self._check_comment(token)
-            elif token.type == tokenize.STRING:
-                yield from self._check_string_token(token)
-            else:
-                yield from self._check_general_token(token)
-
-    def _check_comment(
-        self, token
-    ) -> Generator[Tuple[int, int, str, type], None, None]:
-        """Check comment tokens for non-ASCII characters."""
-        comment_text = token.string
-        for i, char in enumerate(comment_text):
-            if ord(char) > 127:
-                col_offset = token.start[1] + i
-                yield (
-                    token.start[0],
-                    col_offset,
-                    f"{self.ASC003} Non-ASCII character '{char}' "
-                    f"(U+{ord(char):04X}) found in comment",
-                    type(self),
-                )
-                break  # Report only first occurrence per comment
-
-    def _check_string_token(
-        self, token
-    ) -> Generator[Tuple[int, int, str, type], None, None]:
-        """Check string tokens for non-ASCII characters."""
-        string_text = token.string
-
-        # Skip checking string literals meant to contain Unicode
-        # (like raw strings or those with encoding prefixes)
-        if string_text.lower().startswith(
-            ('r"', "r'", 'u"', "u'", 'b"', "b'")
-        ):
-            return
-
-        for i, char in enumerate(string_text):
-            if ord(char) > 127:
-                col_offset = token.start[1] + i
-                yield (
-                    token.start[0],
-                    col_offset,
-                    f"{self.ASC002} Non-ASCII character '{char}' "
-                    f"(U+{ord(char):04X}) found in string literal",
-                    type(self),
-                )
-                break  # Report only first occurrence per string
-
-    def _check_general_token(
-        self, token
-    ) -> Generator[Tuple[int, int, str, type], None, None]:
-        """Check general tokens for non-ASCII characters."""
-        # Skip certain token types that commonly contain Unicode
-        skip_types = {tokenize.STRING, tokenize.COMMENT, tokenize.ENCODING}
-        if token.type in skip_types:
-            return
+            # str.isascii() scans in C, so pure-ASCII tokens never reach
+            # the regex scan below
+            token_text = token.string
+            if token_text.isascii():
+                continue
+
+            template = _MSG_TEMPLATES.get(token.type, _GENERAL_TEMPLATE)
+
+            # Skip checking string literals meant to contain Unicode
+            # (like raw strings or those with encoding prefixes)
+            if token.type == tokenize.STRING:
+                head = token_text[:3].lower()
+                if head[:2] in _SKIP_PREFIXES or head in _SKIP_PREFIXES:
+                    continue
 
+            violations.append(self._scan(token, template))
+
+        return violations
+
+    def _scan(self, token, template: str) -> Tuple[int, int, str, type]:
+        """Build the violation for the first non-ASCII character.
+
+        The token must contain non-ASCII text; _check_tokens filters with
+        isascii() before calling this.
+        """
         token_text = token.string
-        for i, char in enumerate(token_text):
-            if ord(char) > 127:
-                col_offset = token.start[1] + i
-                yield (
-                    token.start[0],
-                    col_offset,
-                    f"{self.ASC001} Non-ASCII character '{char}' "
-                    f"(U+{ord(char):04X}) found in source code",
-                    type(self),
-                )
-                break  # Report only first occurrence per token
+        i = _NON_ASCII.search(token_text).start()
+        line, start_col = token.start
+        char = token_text[i]
+        return (
+            line,
+            start_col + i,
+            template.format(c=char, cp=ord(char)),
+            self._cls,
+        )
 
 
 # TODO: Future enhancement - AST-based checking for granular validation
@@ -162,6 +174,8 @@ class AsciiChecker:
 
 
 # Entry point for the plugin
-def ascii_checker_factory(tree, filename: str, file_tokens: list = None):
+def ascii_checker_factory(
+    tree, filename: str, file_tokens: list = None, lines: list = None
+):
     """Factory function to create AsciiChecker instances."""
-    return AsciiChecker(tree, file_tokens, filename)
+    return AsciiChecker(tree, file_tokens, filename, lines)
@@ -31,7 +31,8 @@ class TestAsciiChecker:
             # Handle incomplete code samples
             pass
 
-        checker = AsciiChecker(tree, tokens, filename)
+        lines = code.splitlines(keepends=True)
+        checker = AsciiChecker(tree, tokens, filename, lines)
         return list(checker.run())
 
     def test_ascii_code_passes(self):
@@ -102,6 +103,22 @@ def unicode_strings():
         # We may or may not flag these depending on our policy
         # The test documents the current behavior
 
+    def test_uppercase_string_prefixes_ignored(self):
+        """Test that prefixes are matched regardless of case."""
+        code = 'a = R"Héllo"\nb = U"Wørld"\nc = r"Héllo"\n'
+        violations = self._check_code(code)
+        assert not any("ASC002" in v[2] for v in violations)
+
+    def test_bytes_prefixes_ignored(self):
+        """Test that every bytes literal prefix form is skipped."""
+        for prefix in ("b", "B", "rb", "Rb", "bR", "BR", "br"):
+            code = f'x = {prefix}"Héllo"\n'
+            tokens = list(tokenize.generate_tokens(StringIO(code).readline))
+
+            # Not valid Python, so no AST is built for these samples
+            checker = AsciiChecker(None, tokens, "<test>")
+            assert list(checker.run()) == [], prefix
+
     def test_multiple_violations_same_line(self):
         """Test handling of multiple violations on the same line."""
         code = """
@@ -130,6 +147,20 @@ variablé = "Héllo"
             assert message.startswith("ASC00")
             assert "U+" in message  # Unicode code point should be included
 
+    def test_full_message_text(self):
+        """Test the complete message text for each error code."""
+        code = 'variablé = "Héllo"  # Commént\n'
+        messages = [v[2] for v in self._check_code(code)]
+
+        assert messages == [
+            f"{AsciiChecker.ASC001} Non-ASCII character 'é' (U+00E9) "
+            "found in source code",
+            f"{AsciiChecker.ASC002} Non-ASCII character 'é' (U+00E9) "
+            "found in string literal",
+            f"{AsciiChecker.ASC003} Non-ASCII character 'é' (U+00E9) "
+            "found in comment",
+        ]
+
     def test_empty_file(self):
         """Test handling of empty files."""
         violations = self._check_code("")
@@ -228,6 +259,15 @@ def test():
             assert violation[1] >= 0
             assert violation[1] < 100  # Reasonable upper bound
 
+    def test_exact_column_of_first_non_ascii(self):
+        """Test that the column points at the first non-ASCII character."""
+        code = 'x = "abcé ü"  # okñ\n'
+        violations = self._check_code(code)
+
+        assert [(v[0], v[1]) for v in violations] == [(1, 8), (1, 18)]
+        assert "U+00E9" in violations[0][2]
+        assert "U+00F1" in violations[1][2]
+
 
 class TestAsciiCheckerIntegration:
     """Integration tests for the AsciiChecker plugin."""
@@ -244,13 +284,56 @@ class TestAsciiCheckerIntegration:
         assert isinstance(checker, AsciiChecker)
         assert checker.filename == "<test>"
 
+    def test_ascii_lines_take_fast_path(self):
+        """Test that all-ASCII lines skip token checking entirely."""
+        # Deliberately mismatched: only the token stream has non-ASCII,
+        # so any violation would mean the tokens were walked
+        code = 'message = "Héllo"\n'
+        tokens = list(tokenize.generate_tokens(StringIO(code).readline))
+        lines = ['message = "Hello"\n']
+
+        checker = AsciiChecker(ast.parse(code), tokens, "<test>", lines)
+        assert list(checker.run()) == []
+
+        checker = AsciiChecker(ast.parse(code), tokens, "<test>")
+        assert len(list(checker.run())) == 1
+
+    def test_fast_path_does_not_change_results(self):
+        """Test that passing lines gives the same violations as tokens."""
+        code = 'variablé = "Héllo"  # Commént\n'
+        tokens = list(tokenize.generate_tokens(StringIO(code).readline))
+        lines = code.splitlines(keepends=True)
+
+        with_lines = AsciiChecker(None, tokens, "<test>", lines).run()
+        without_lines = AsciiChecker(None, tokens, "<test>").run()
+        assert list(with_lines) == list(without_lines)
+
+    def test_clean_file_on_disk_does_not_hide_violations(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that checked content wins over a same-named file on disk.
+
+        This is how editors lint unsaved buffers via
+        ``flake8 --stdin-display-name=foo.py -``.
+        """
+        (tmp_path / "foo.py").write_text("message = 'Hello'\n")
+        monkeypatch.chdir(tmp_path)
+
+        code = 'message = "Héllo"  # Commént\n'
+        tokens = list(tokenize.generate_tokens(StringIO(code).readline))
+        lines = code.splitlines(keepends=True)
+
+        checker = AsciiChecker(ast.parse(code), tokens, "foo.py", lines)
+        codes = [v[2][:6] for v in checker.run()]
+        assert codes == ["ASC002", "ASC003"]
+
     def test_plugin_registration_format(self):
         """Test that the plugin follows Flake8 registration format."""
         # This test ensures our plugin class has the right interface
         tree = ast.parse("print('hello')")
         checker = AsciiChecker(tree, [], "<test>")
 
-        # Should have a run method that returns a generator
+        # Should have a run method that returns an iterator
         assert hasattr(checker, "run")
         assert callable(checker.run)
 